@@ -1,12 +1,18 @@
 """Configuration settings for IRS Bulletin Scraper."""
 
-MAX_WORKERS = 5  # Concurrent downloads
+MAX_WORKERS = 5  # Most concurrent downloads (upper bound for throughput tuning)
+MIN_WORKERS = 1  # Lower bound when tuning concurrency to throughput
+THROUGHPUT_PROBE_INTERVAL = 3  # Seconds between concurrency adjustments
+MAX_CONCURRENT_IO = 4  # Download writes allowed at once across threads
 MAX_RETRIES = 3  # Number of retry attempts for failed requests
 REQUEST_TIMEOUT = 30  # Request timeout in seconds
-DELAY_BETWEEN_PAGES = 1  # Seconds to wait between page requests
+DELAY_BETWEEN_PAGES = 1  # Minimum seconds between starting page requests
+PAGE_FETCH_WORKERS = 4  # Index pages fetched concurrently
+PAGE_CACHE_FILENAME = ".page_cache.json"  # Index page validators, in the output dir
 
 # Download settings
-CHUNK_SIZE = 8192  # Download chunk size in bytes (8KB chunks)
+CHUNK_SIZE = 1048576  # Download copy buffer size in bytes (1MB)
+PART_SUFFIX = ".part"  # Suffix for downloads that are still in progress
 
 # CSV settings
 CSV_FIELDNAMES = ["file_name", "file_size_mb", "download_timestamp", "status"]
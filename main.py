@@ -1,149 +1,305 @@
 import argparse
 import csv
+import functools
+import itertools
+import logging
 import os
+import random
 import re
+import socket
 import time
-from concurrent.futures import ThreadPoolExecutor
-from urllib.parse import parse_qs, urljoin, urlparse
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import formatdate, parsedate_to_datetime
+from urllib.parse import urljoin
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+
+logger = logging.getLogger(__name__)
 
 # Constants
 OUTPUT_FOLDER = "export"
 CSV_SUMMARY_FILE = "export_summary.csv"
 BASE_URL = "https://www.irs.gov/internal-revenue-bulletins"
 MAX_WORKERS = 8
+PAGE_WORKERS = 4  # Concurrent index page fetches
+PAGE_BATCH_SIZE = 10  # Index pages fetched ahead per batch
 MAX_RETRIES = 3
+MAX_BACKOFF = 30  # Longest wait between retries, in seconds
+REQUEST_TIMEOUT = 30
+CHUNK_SIZE = 256 * 1024  # Download chunk size in bytes
+MAX_FILE_SIZE = 500 * 1024 * 1024  # Refuse downloads larger than 500 MB
+PDF_MAGIC = b"%PDF-"
+PART_SUFFIX = ".part"  # Suffix for downloads that are still in progress
+_PDF_HREF_RE = re.compile(r"/pub/irs-irbs/irb\d+-\d+\.pdf")
+# Only anchors and the pagination list are needed from each index page
+_INDEX_PAGE_STRAINER = SoupStrainer(["a", "ul"])
+NEXT_PAGE_SELECTOR = "ul.pagination li.pager__item--next a[href]"
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+)
+
+
+@dataclass(frozen=True)
+class Config:
+    """Settings for a single scraper run."""
+
+    output_folder: str = OUTPUT_FOLDER
+    csv_file: str = CSV_SUMMARY_FILE
+    max_workers: int = MAX_WORKERS
+    max_retries: int = MAX_RETRIES
+    timeout: int = REQUEST_TIMEOUT
+    chunk_size: int = CHUNK_SIZE
+    refresh: bool = False  # Re-check existing files against the server
+
+
+def install_dns_cache():
+    """Memoize socket.getaddrinfo so www.irs.gov is resolved once per run.
+
+    Failed lookups raise and are therefore not cached.
+    """
+    if not hasattr(socket.getaddrinfo, "cache_info"):
+        socket.getaddrinfo = functools.lru_cache(maxsize=32)(socket.getaddrinfo)
+
+
+def create_session(cfg):
+    """Create an HTTP session that reuses keep-alive connections to irs.gov."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=max(cfg.max_workers, PAGE_WORKERS),
+        max_retries=0,
+    )
+    session.mount("https://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    # Index pages are compressible HTML; br is included when brotli is installed
+    session.headers["Accept-Encoding"] = DEFAULT_ACCEPT_ENCODING
+    return session
 
 
-def create_output_folder():
+def create_output_folder(cfg):
     """Create output folder if it doesn't exist."""
-    if not os.path.exists(OUTPUT_FOLDER):
-        os.makedirs(OUTPUT_FOLDER)
-        print(f"Created output folder: {OUTPUT_FOLDER}")
+    if not os.path.exists(cfg.output_folder):
+        os.makedirs(cfg.output_folder)
+        logger.info(f"Created output folder: {cfg.output_folder}")
 
 
-def get_bulletin_links():
-    """Scrape all bulletin links from the IRS website."""
-    bulletin_links = []
-    page_num = 0
-    max_pages = 100
+def remove_partial_downloads(cfg):
+    """Delete .part files left behind by an interrupted run."""
+    with os.scandir(cfg.output_folder) as entries:
+        for entry in entries:
+            if entry.name.endswith(PART_SUFFIX) and entry.is_file():
+                os.remove(entry.path)
+                logger.info(f"Removed partial download: {entry.name}")
+
 
-    while page_num < max_pages:
-        url = BASE_URL if page_num == 0 else f"{BASE_URL}?page={page_num}"
-        print(f"Scraping page {page_num + 1}: {url}")
+def _sleep_backoff(cfg, retries, response=None):
+    """Wait before the next retry, honoring the server's Retry-After header.
 
-        retries = 0
-        while retries < MAX_RETRIES:
+    Without a Retry-After header the delay grows exponentially with jitter so
+    concurrent workers don't retry in lockstep. No wait after the last attempt.
+    """
+    if retries >= cfg.max_retries:
+        return
+
+    delay = None
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
             try:
-                response = requests.get(url, timeout=30)
-                if response.status_code == 200:
-                    break
-                retries += 1
-                print(
-                    f"Retry {retries}/{MAX_RETRIES} - Status code: {response.status_code}"
-                )
-                time.sleep(2)
-            except Exception as e:
-                retries += 1
-                print(f"Retry {retries}/{MAX_RETRIES} - Error: {str(e)}")
-                time.sleep(2)
+                retry_at = parsedate_to_datetime(retry_after)
+                delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                delay = None
 
-        if retries == MAX_RETRIES:
-            print(f"Failed to fetch page {page_num + 1} after {MAX_RETRIES} retries.")
-            break
+    if delay is None:
+        delay = 2**retries + random.uniform(0, 1)
 
-        soup = BeautifulSoup(response.content, "html.parser")
+    time.sleep(min(MAX_BACKOFF, max(0, delay)))
 
-        links_found = False
-        for link in soup.find_all(
-            "a", href=re.compile(r"/pub/irs-irbs/irb\d+-\d+\.pdf")
-        ):
-            pdf_url = urljoin("https://www.irs.gov", link["href"])
-            bulletin_name = os.path.basename(pdf_url)
 
-            if not any(bulletin_name == name for name, _ in bulletin_links):
-                bulletin_links.append((bulletin_name, pdf_url))
-                links_found = True
+def fetch_index_page(page_num, cfg, session):
+    """Fetch and parse one bulletin index page, or return None on failure."""
+    url = BASE_URL if page_num == 0 else f"{BASE_URL}?page={page_num}"
+    logger.info(f"Scraping page {page_num + 1}: {url}")
 
-        if not links_found:
-            print(
-                f"No bulletin links found on page {page_num + 1}."
+    retries = 0
+    while retries < cfg.max_retries:
+        try:
+            response = session.get(url, timeout=cfg.timeout)
+            if response.status_code == 200:
+                break
+            retries += 1
+            logger.warning(
+                f"Retry {retries}/{cfg.max_retries} - "
+                f"Status code: {response.status_code}"
             )
-            break
+            _sleep_backoff(cfg, retries, response)
+        except Exception as e:
+            retries += 1
+            logger.warning(f"Retry {retries}/{cfg.max_retries} - Error: {str(e)}")
+            _sleep_backoff(cfg, retries)
 
-        next_page_link = None
-        pagination = soup.find("ul", class_="pagination")
+    if retries == cfg.max_retries:
+        logger.error(
+            f"Failed to fetch page {page_num + 1} after {cfg.max_retries} retries."
+        )
+        return None
 
-        if pagination:
-            for li in pagination.find_all("li", class_="pager__item--next"):
-                a_tag = li.find("a")
-                if a_tag and "Next" in a_tag.text:
-                    next_page_link = a_tag
+    return BeautifulSoup(response.content, "lxml", parse_only=_INDEX_PAGE_STRAINER)
+
+
+def find_next_page_link(soup):
+    """Return the pagination "Next" anchor of an index page, if any."""
+    return soup.select_one(NEXT_PAGE_SELECTOR)
+
+
+def get_bulletin_links(cfg, session):
+    """Scrape all bulletin links from the IRS website.
+
+    Index pages are fetched in batches of PAGE_BATCH_SIZE so their latency
+    overlaps, then processed in page order until a page without new links or
+    without a "Next" link is reached.
+    """
+    bulletin_links = []
+    seen_names = set()
+    max_pages = 100
+    fetch_page = functools.partial(fetch_index_page, cfg=cfg, session=session)
+
+    # Probe the first page on its own before fetching ahead speculatively
+    batch_start = 0
+    batch_size = 1
+
+    with ThreadPoolExecutor(
+        max_workers=PAGE_WORKERS, thread_name_prefix="index"
+    ) as executor:
+        while batch_start < max_pages:
+            page_nums = range(batch_start, min(batch_start + batch_size, max_pages))
+            soups = executor.map(fetch_page, page_nums)
+            reached_end = False
+
+            for page_num, soup in zip(page_nums, soups):
+                if soup is None:
+                    reached_end = True
                     break
 
-            if not next_page_link:
-                for a_tag in pagination.find_all("a"):
-                    if "Next" in a_tag.text:
-                        next_page_link = a_tag
-                        break
+                links_found = False
+                for link in soup.find_all("a", href=_PDF_HREF_RE):
+                    pdf_url = urljoin("https://www.irs.gov", link["href"])
+                    bulletin_name = os.path.basename(pdf_url)
 
-        if not next_page_link:
-            print(
-                f"No 'Next' link found on page {page_num + 1}, reached the last page."
-            )
-            break
+                    if bulletin_name not in seen_names:
+                        seen_names.add(bulletin_name)
+                        bulletin_links.append((bulletin_name, pdf_url))
+                        links_found = True
+
+                if not links_found:
+                    logger.info(f"No bulletin links found on page {page_num + 1}.")
+                    reached_end = True
+                    break
 
-        if "href" in next_page_link.attrs:
-            next_url = next_page_link["href"]
-            parsed_url = urlparse(next_url)
-            query_params = parse_qs(parsed_url.query)
+                if not find_next_page_link(soup):
+                    logger.info(
+                        f"No 'Next' link found on page {page_num + 1}, "
+                        "reached the last page."
+                    )
+                    reached_end = True
+                    break
 
-            if "page" in query_params:
-                try:
-                    page_num = int(query_params["page"][0])
-                except ValueError:
-                    page_num += 1
-            else:
-                page_num += 1
-        else:
-            page_num += 1
+            if reached_end:
+                # Drop speculative fetches for pages past the end
+                executor.shutdown(wait=True, cancel_futures=True)
+                break
 
-        print(f"Moving to page {page_num + 1}")
-        time.sleep(2)
+            batch_start = page_nums.stop
+            batch_size = PAGE_BATCH_SIZE
 
-    print(f"Found {len(bulletin_links)} bulletins across all pages")
+    logger.info(f"Found {len(bulletin_links)} bulletins across all pages")
     return bulletin_links
 
 
-def download_bulletin(bulletin_info):
-    """Download a bulletin PDF file."""
-    bulletin_name, pdf_url = bulletin_info
-    file_path = os.path.join(OUTPUT_FOLDER, bulletin_name)
+def download_bulletin(bulletin_info, cfg, session, existing_names=frozenset()):
+    """Download a bulletin PDF file.
 
-    if os.path.exists(file_path):
-        print(f"Skipping {bulletin_name} (already exists)")
-        file_size_mb = os.path.getsize(file_path) / (1024 * 1024)
-        return {
-            "file_name": bulletin_name,
-            "file_size_mb": file_size_mb,
-            "status": "skipped",
-        }
+    ``existing_names`` holds the PDFs already in the output folder, listed
+    once up front so workers don't stat the disk for every bulletin.
+    """
+    bulletin_name, pdf_url = bulletin_info
+    file_path = os.path.join(cfg.output_folder, bulletin_name)
+
+    # PDFs are already compressed, so ask for them as-is
+    headers = {"Accept-Encoding": "identity"}
+    if bulletin_name in existing_names:
+        if not cfg.refresh:
+            return skip_download(bulletin_name, file_path, "already exists")
+        # Only transfer the body if the bulletin changed since we saved it
+        headers["If-Modified-Since"] = formatdate(
+            os.path.getmtime(file_path), usegmt=True
+        )
 
     retries = 0
-    while retries < MAX_RETRIES:
+    while retries < cfg.max_retries:
         try:
-            print(f"Downloading {bulletin_name} from {pdf_url}")
-            response = requests.get(pdf_url, stream=True, timeout=30)
+            logger.info(f"Downloading {bulletin_name} from {pdf_url}")
+            response = session.get(
+                pdf_url, stream=True, timeout=cfg.timeout, headers=headers
+            )
 
-            if response.status_code == 200:
-                with open(file_path, "wb") as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
+            if response.status_code == 304:
+                response.close()
+                return skip_download(bulletin_name, file_path, "not modified")
 
-                file_size_mb = os.path.getsize(file_path) / (1024 * 1024)
-                print(f"Downloaded {bulletin_name} ({file_size_mb:.2f} MB)")
+            if response.status_code == 200:
+                # IRS occasionally serves HTML error pages with a 200 status
+                content_type = response.headers.get("Content-Type", "")
+                if content_type and "pdf" not in content_type.lower():
+                    return reject_download(
+                        bulletin_name, response, f"Content-Type is {content_type}"
+                    )
+
+                content_length = int(response.headers.get("Content-Length") or 0)
+                if content_length > MAX_FILE_SIZE:
+                    return reject_download(
+                        bulletin_name, response, f"{content_length} bytes is too large"
+                    )
+
+                chunks = response.iter_content(chunk_size=cfg.chunk_size)
+                first_chunk = next(chunks, b"")
+                if not first_chunk.startswith(PDF_MAGIC):
+                    return reject_download(bulletin_name, response, "not a PDF file")
+
+                # Write to a .part file so an interrupted download never
+                # leaves a truncated PDF under the final name
+                part_path = file_path + PART_SUFFIX
+                bytes_written = 0
+                try:
+                    with open(part_path, "wb") as f:
+                        for chunk in itertools.chain([first_chunk], chunks):
+                            bytes_written += len(chunk)
+                            if bytes_written > MAX_FILE_SIZE:
+                                break
+                            f.write(chunk)
+
+                    if bytes_written > MAX_FILE_SIZE:
+                        return reject_download(
+                            bulletin_name, response, "exceeded the maximum file size"
+                        )
+
+                    os.replace(part_path, file_path)
+                finally:
+                    if os.path.exists(part_path):
+                        os.remove(part_path)
+
+                file_size_mb = bytes_written / (1024 * 1024)
+                logger.info(f"Downloaded {bulletin_name} ({file_size_mb:.2f} MB)")
                 return {
                     "file_name": bulletin_name,
                     "file_size_mb": file_size_mb,
@@ -151,57 +307,96 @@ def download_bulletin(bulletin_info):
                 }
             else:
                 retries += 1
-                print(
-                    f"Retry {retries}/{MAX_RETRIES} - Status code: {response.status_code}"
+                logger.warning(
+                    f"Retry {retries}/{cfg.max_retries} - "
+                    f"Status code: {response.status_code}"
                 )
-                time.sleep(2)
+                _sleep_backoff(cfg, retries, response)
         except Exception as e:
             retries += 1
-            print(f"Retry {retries}/{MAX_RETRIES} - Error: {str(e)}")
-            time.sleep(2)
+            logger.warning(f"Retry {retries}/{cfg.max_retries} - Error: {str(e)}")
+            _sleep_backoff(cfg, retries)
 
-    print(f"Failed to download {bulletin_name} after {MAX_RETRIES} retries.")
+    logger.error(
+        f"Failed to download {bulletin_name} after {cfg.max_retries} retries."
+    )
     return None
 
 
-def get_existing_files():
+def skip_download(bulletin_name, file_path, reason):
+    """Record an existing bulletin that does not need downloading."""
+    logger.info(f"Skipping {bulletin_name} ({reason})")
+    file_size_mb = os.path.getsize(file_path) / (1024 * 1024)
+    return {
+        "file_name": bulletin_name,
+        "file_size_mb": file_size_mb,
+        "status": "skipped",
+    }
+
+
+def reject_download(bulletin_name, response, reason):
+    """Abort a download whose response is not an acceptable PDF."""
+    response.close()
+    logger.warning(f"Discarding {bulletin_name}: {reason}")
+    return {
+        "file_name": bulletin_name,
+        "file_size_mb": 0,
+        "status": "invalid",
+    }
+
+
+def iter_download_results(executor, download, bulletin_links, window):
+    """Run ``download`` on the executor, yielding results as they complete.
+
+    At most ``window`` downloads are submitted at a time, so the executor's
+    queue stays small no matter how many bulletins there are.
+    """
+    bulletin_links = iter(bulletin_links)
+    pending = set()
+
+    while True:
+        for bulletin_info in itertools.islice(bulletin_links, window - len(pending)):
+            pending.add(executor.submit(download, bulletin_info))
+
+        if not pending:
+            return
+
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield future.result()
+
+
+def get_existing_files(cfg):
     """Get list of existing files and their sizes in the output folder."""
-    if not os.path.exists(OUTPUT_FOLDER):
+    if not os.path.exists(cfg.output_folder):
         return []
 
     existing_files = []
-    for filename in os.listdir(OUTPUT_FOLDER):
-        if filename.endswith(".pdf"):
-            file_path = os.path.join(OUTPUT_FOLDER, filename)
-            file_size_mb = os.path.getsize(file_path) / (1024 * 1024)
-            existing_files.append(
-                {
-                    "file_name": filename,
-                    "file_size_mb": file_size_mb,
-                    "status": "existing",
-                }
-            )
+    with os.scandir(cfg.output_folder) as entries:
+        for entry in entries:
+            if entry.name.endswith(".pdf") and entry.is_file():
+                file_size_mb = entry.stat().st_size / (1024 * 1024)
+                existing_files.append(
+                    {
+                        "file_name": entry.name,
+                        "file_size_mb": file_size_mb,
+                        "status": "existing",
+                    }
+                )
 
     return existing_files
 
 
-def create_csv_summary(download_results):
-    """Create a CSV summary of downloaded files."""
-    with open(CSV_SUMMARY_FILE, "w", newline="") as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(["file_name", "file_size_mb", "status"])
-
-        for result in download_results:
-            if result:
-                writer.writerow(
-                    [
-                        result["file_name"],
-                        f"{result['file_size_mb']:.2f}",
-                        result["status"],
-                    ]
-                )
-
-    print(f"CSV summary created: {CSV_SUMMARY_FILE}")
+def write_summary_row(csvfile, writer, result):
+    """Append one result to the CSV summary and flush it to disk."""
+    writer.writerow(
+        [
+            result["file_name"],
+            f"{result['file_size_mb']:.2f}",
+            result["status"],
+        ]
+    )
+    csvfile.flush()
 
 
 def main():
@@ -212,47 +407,103 @@ def main():
     parser.add_argument(
         "--max-retries", type=int, help="Maximum number of retries for failed requests"
     )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Re-download existing bulletins that changed on the server",
+    )
     args = parser.parse_args()
 
-    global OUTPUT_FOLDER, CSV_SUMMARY_FILE, MAX_WORKERS, MAX_RETRIES
-    if args.output:
-        OUTPUT_FOLDER = args.output
-    if args.csv:
-        CSV_SUMMARY_FILE = args.csv
-    if args.threads:
-        MAX_WORKERS = args.threads
-    if args.max_retries:
-        MAX_RETRIES = args.max_retries
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(threadName)s %(levelname)s %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+
+    cfg = Config(
+        output_folder=args.output or OUTPUT_FOLDER,
+        csv_file=args.csv or CSV_SUMMARY_FILE,
+        max_workers=args.threads or MAX_WORKERS,
+        max_retries=args.max_retries or MAX_RETRIES,
+        refresh=args.refresh,
+    )
 
-    create_output_folder()
+    install_dns_cache()
+    with create_session(cfg) as session:
+        run(cfg, session)
 
-    existing_files = get_existing_files()
+
+def run(cfg, session):
+    """Scrape bulletin links, download them and write the CSV summary."""
+    create_output_folder(cfg)
+    remove_partial_downloads(cfg)
+
+    existing_files = get_existing_files(cfg)
     if existing_files:
-        print(f"Found {len(existing_files)} existing files in {OUTPUT_FOLDER}")
+        logger.info(
+            f"Found {len(existing_files)} existing files in {cfg.output_folder}"
+        )
 
-    bulletin_links = get_bulletin_links()
+    bulletin_links = get_bulletin_links(cfg, session)
 
     if not bulletin_links:
-        print("No bulletin links found, exiting.")
+        logger.warning("No bulletin links found, exiting.")
         return
 
-    download_results = []
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        download_results = list(executor.map(download_bulletin, bulletin_links))
-
-    download_results = [result for result in download_results if result]
+    # Rows are written as results arrive so an interrupted run keeps its summary
+    status_counts = Counter()
+    with open(cfg.csv_file, "w", newline="") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(["file_name", "file_size_mb", "status"])
 
-    create_csv_summary(download_results)
+        to_download = bulletin_links
+        if not cfg.refresh:
+            # Record existing bulletins here rather than spending a worker on each
+            existing_by_name = {f["file_name"]: f for f in existing_files}
+            to_download = []
+            for bulletin_name, pdf_url in bulletin_links:
+                existing = existing_by_name.get(bulletin_name)
+                if existing:
+                    result = {
+                        "file_name": bulletin_name,
+                        "file_size_mb": existing["file_size_mb"],
+                        "status": "skipped",
+                    }
+                    write_summary_row(csvfile, writer, result)
+                    status_counts[result["status"]] += 1
+                else:
+                    to_download.append((bulletin_name, pdf_url))
+            logger.info(
+                f"Skipping {status_counts['skipped']} bulletins that already exist"
+            )
 
-    downloaded = sum(
-        1 for result in download_results if result["status"] == "downloaded"
+        if to_download:
+            existing_names = frozenset(f["file_name"] for f in existing_files)
+            download = functools.partial(
+                download_bulletin,
+                cfg=cfg,
+                session=session,
+                existing_names=existing_names,
+            )
+            with ThreadPoolExecutor(max_workers=cfg.max_workers) as executor:
+                for result in iter_download_results(
+                    executor, download, to_download, window=2 * cfg.max_workers
+                ):
+                    if result:
+                        write_summary_row(csvfile, writer, result)
+                        status_counts[result["status"]] += 1
+
+    logger.info(f"CSV summary created: {cfg.csv_file}")
+
+    logger.info(
+        f"Downloaded {status_counts['downloaded']} new bulletins, "
+        f"skipped {status_counts['skipped']} existing bulletins"
     )
-    skipped = sum(1 for result in download_results if result["status"] == "skipped")
-
-    print(
-        f"Downloaded {downloaded} new bulletins, skipped {skipped} existing bulletins"
+    if status_counts["invalid"]:
+        logger.info(f"Discarded {status_counts['invalid']} non-PDF responses")
+    logger.info(
+        f"Total: {sum(status_counts.values())} bulletins in {cfg.output_folder}"
     )
-    print(f"Total: {len(download_results)} bulletins in {OUTPUT_FOLDER}")
 
 
 if __name__ == "__main__":
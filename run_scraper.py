@@ -31,15 +31,14 @@ def run_scraper(args) -> None:
     Args:
         args: Parsed command line arguments
     """
-    scraper = IRSBulletinScraper(
+    with IRSBulletinScraper(
         output_dir=args.output_dir,
         csv_file=args.csv_file,
         max_workers=args.max_workers,
         max_retries=args.max_retries,
         max_pages=args.max_pages,
-    )
-
-    scraper.run()
+    ) as scraper:
+        scraper.run()
 
 
 def check_bulletins(args) -> None:
@@ -48,13 +47,12 @@ def check_bulletins(args) -> None:
     Args:
         args: Parsed command line arguments
     """
-    scraper = IRSBulletinScraper(
+    with IRSBulletinScraper(
         output_dir=args.output_dir,
         csv_file=args.csv_file,
         max_pages=args.check_pages,
-    )
-
-    results = scraper.run_check(limit=args.limit, report_file=args.report_file)
+    ) as scraper:
+        results = scraper.run_check(limit=args.limit, report_file=args.report_file)
 
     # Print summary to console
     print("\nCheck Results:")
@@ -74,39 +72,38 @@ def process_bulletins(args) -> None:
     Args:
         args: Parsed command line arguments
     """
-    scraper = IRSBulletinScraper(output_dir=args.output_dir)
-
-    if args.validate:
-        print("Validating PDF files...")
-        validation_results = scraper.validate_pdf_files()
-        valid_count = sum(validation_results.values())
-        total_count = len(validation_results)
-        print(f"Validation complete: {valid_count}/{total_count} files valid")
-
-    if args.cleanup:
-        print("Cleaning up invalid files...")
-        deleted_files = scraper.cleanup_invalid_files(dry_run=args.dry_run)
-        if deleted_files:
-            action = "Would delete" if args.dry_run else "Deleted"
-            print(f"{action} {len(deleted_files)} invalid files")
-        else:
-            print("No invalid files found")
-
-    if args.stats:
-        print("Generating statistics...")
-        stats = scraper.get_bulletin_statistics()
-        print("\nBulletin Statistics:")
-        print(f"  Total files: {stats['total_files']}")
-        print(f"  Total size: {stats['total_size_mb']} MB")
-        print(f"  Valid files: {stats['valid_files']}")
-        print(f"  Invalid files: {stats['invalid_files']}")
-        print(f"  Average size: {stats['average_size_mb']} MB")
-
-    if args.inventory:
-        print("Generating inventory report...")
-        report = scraper.generate_inventory_report(args.inventory)
-        if not args.inventory:
-            print(report)
+    with IRSBulletinScraper(output_dir=args.output_dir) as scraper:
+        if args.validate:
+            print("Validating PDF files...")
+            validation_results = scraper.validate_pdf_files()
+            valid_count = sum(validation_results.values())
+            total_count = len(validation_results)
+            print(f"Validation complete: {valid_count}/{total_count} files valid")
+
+        if args.cleanup:
+            print("Cleaning up invalid files...")
+            deleted_files = scraper.cleanup_invalid_files(dry_run=args.dry_run)
+            if deleted_files:
+                action = "Would delete" if args.dry_run else "Deleted"
+                print(f"{action} {len(deleted_files)} invalid files")
+            else:
+                print("No invalid files found")
+
+        if args.stats:
+            print("Generating statistics...")
+            stats = scraper.get_bulletin_statistics()
+            print("\nBulletin Statistics:")
+            print(f"  Total files: {stats['total_files']}")
+            print(f"  Total size: {stats['total_size_mb']} MB")
+            print(f"  Valid files: {stats['valid_files']}")
+            print(f"  Invalid files: {stats['invalid_files']}")
+            print(f"  Average size: {stats['average_size_mb']} MB")
+
+        if args.inventory:
+            print("Generating inventory report...")
+            report = scraper.generate_inventory_report(args.inventory)
+            if not args.inventory:
+                print(report)
 
 
 def main():
@@ -142,7 +139,7 @@ def main():
         "--max-workers",
         type=int,
         default=5,
-        help="Number of concurrent downloads (default: 5)",
+        help="Maximum number of concurrent downloads (default: 5)",
     )
     scraper_parser.add_argument(
         "--max-retries",
@@ -1,34 +1,254 @@
 """IRS Bulletin Scraper - Unified Implementation."""
 
 import csv
+import itertools
+import json
 import logging
 import os
+import queue
 import re
+import shutil
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 from urllib.parse import urljoin
 
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+from requests.adapters import HTTPAdapter
 
 from ...utils.paths import IRS_BULLETINS_CSV, IRS_BULLETINS_DIR, ensure_dir_exists
 from .config import (
     CHUNK_SIZE,
     CSV_FIELDNAMES,
     DELAY_BETWEEN_PAGES,
+    MAX_CONCURRENT_IO,
     MAX_RETRIES,
     MAX_WORKERS,
+    MIN_WORKERS,
+    PAGE_CACHE_FILENAME,
+    PAGE_FETCH_WORKERS,
+    PART_SUFFIX,
     REQUEST_TIMEOUT,
+    THROUGHPUT_PROBE_INTERVAL,
 )
 
 
+class _AdaptiveWorkerPool:
+    """Thread pool whose size follows measured throughput.
+
+    Every probe interval the bytes streamed in that window are compared with
+    the previous window: higher throughput adds a worker, lower throughput
+    removes one, never going above max_workers. ThreadPoolExecutor can't be
+    resized, so workers are plain threads pulling from a queue.
+    """
+
+    def __init__(
+        self,
+        func: Callable[[Any, Callable[[int], None]], Any],
+        max_workers: int,
+        min_workers: int = MIN_WORKERS,
+        probe_interval: float = THROUGHPUT_PROBE_INTERVAL,
+    ):
+        """Initialize the pool.
+
+        Args:
+            func: Function run on each submitted item, called with the item and
+                a callback that records bytes transferred while it runs
+            max_workers: Number of workers to start with and the most the
+                optimizer may grow back to
+            min_workers: Fewest workers the optimizer may shrink to
+            probe_interval: Seconds between throughput measurements
+        """
+        self._func = func
+        self._min_workers = min(min_workers, max_workers)
+        self._max_workers = max_workers
+        self._probe_interval = probe_interval
+        self._target = max_workers
+        self._running = 0
+        self._window_bytes = 0
+        self._results = []
+        self._error = None
+        self._tasks = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._stopped = threading.Event()
+        self._optimizer = threading.Thread(
+            target=self._optimize, name="pool-optimizer", daemon=True
+        )
+
+    def start(self) -> None:
+        """Start the throughput optimizer."""
+        self._optimizer.start()
+
+    def submit(self, item: Any) -> None:
+        """Queue an item for processing.
+
+        Args:
+            item: Argument passed to func
+        """
+        self._tasks.put(item)
+        self._spawn_workers()
+
+    def join(self) -> List[Any]:
+        """Wait for all submitted items and stop the pool.
+
+        Returns:
+            Results of func in completion order
+        """
+        self._closed.set()
+        self._tasks.join()
+        self._stopped.set()
+        self._optimizer.join()
+
+        if self._error:
+            raise self._error
+        return self._results
+
+    def _spawn_workers(self) -> None:
+        """Start threads until the running count reaches the current target."""
+        with self._lock:
+            while self._running < self._target:
+                self._running += 1
+                threading.Thread(target=self._work, daemon=True).start()
+
+    def _work(self) -> None:
+        """Process queued items until the pool shrinks or is closed."""
+        while True:
+            with self._lock:
+                if self._running > self._target:
+                    self._running -= 1
+                    return
+
+            try:
+                item = self._tasks.get(timeout=0.5)
+            except queue.Empty:
+                if self._closed.is_set():
+                    with self._lock:
+                        self._running -= 1
+                    return
+                continue
+
+            try:
+                result = self._func(item, self._record_bytes)
+                with self._lock:
+                    self._results.append(result)
+            except Exception as e:
+                with self._lock:
+                    self._error = self._error or e
+            finally:
+                self._tasks.task_done()
+
+    def _record_bytes(self, nbytes: int) -> None:
+        """Count bytes transferred toward the current probe window."""
+        with self._lock:
+            self._window_bytes += nbytes
+
+    def _optimize(self) -> None:
+        """Nudge the worker target by one toward higher throughput."""
+        last_throughput = None
+
+        while not self._stopped.wait(self._probe_interval):
+            with self._lock:
+                throughput = self._window_bytes / self._probe_interval
+                self._window_bytes = 0
+
+                # With no backlog, throughput reflects the producer rather
+                # than the number of workers, so don't tune on it
+                if last_throughput is not None and not self._tasks.empty():
+                    if throughput > last_throughput:
+                        self._target = min(self._target + 1, self._max_workers)
+                    elif throughput < last_throughput:
+                        self._target = max(self._target - 1, self._min_workers)
+
+            last_throughput = throughput
+            self._spawn_workers()
+
+
+class _RateLimiter:
+    """Spaces acquisitions at least 1/rate seconds apart across threads.
+
+    Unlike a fixed sleep between requests, callers on several threads can
+    have requests in flight at once while the start times stay spaced out.
+    Each caller reserves the next free slot, so slots are handed out in the
+    order acquire() is called.
+    """
+
+    def __init__(self, rate: Optional[float]):
+        """Initialize the rate limiter.
+
+        Args:
+            rate: Acquisitions allowed per second (None for no limit)
+        """
+        self._interval = 1 / rate if rate else 0
+        self._next_slot = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until this caller's slot comes up."""
+        if not self._interval:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class _ThrottledWriter:
+    """File wrapper whose writes hold a shared I/O semaphore.
+
+    Lets a download wait on the network without holding a disk slot, so only
+    the writes themselves count against the concurrent I/O limit. Each write
+    is also reported to an optional progress callback.
+    """
+
+    def __init__(
+        self,
+        f,
+        semaphore: threading.BoundedSemaphore,
+        progress: Optional[Callable[[int], None]] = None,
+    ):
+        """Initialize the writer.
+
+        Args:
+            f: File object opened for binary writing
+            semaphore: Semaphore shared by all concurrent download writes
+            progress: Called with the number of bytes after each write
+        """
+        self._file = f
+        self._semaphore = semaphore
+        self._progress = progress
+
+    def write(self, data: bytes) -> int:
+        """Write a buffer to the file while holding the I/O semaphore.
+
+        Args:
+            data: Bytes to write
+
+        Returns:
+            Number of bytes written
+        """
+        with self._semaphore:
+            written = self._file.write(data)
+        if self._progress:
+            self._progress(written)
+        return written
+
+
 class IRSBulletinScraper:
     """Unified scraper for IRS Internal Revenue Bulletins with checking, downloading, and processing."""
 
     BASE_URL = "https://www.irs.gov/internal-revenue-bulletins"
+    _PDF_HREF_RE = re.compile(r"/pub/irs-irbs/irb\d+-\d+\.pdf")
 
     def __init__(
         self,
@@ -38,16 +258,20 @@ class IRSBulletinScraper:
         max_retries: int = MAX_RETRIES,
         timeout: int = REQUEST_TIMEOUT,
         max_pages: int = None,
+        max_concurrent_io: int = MAX_CONCURRENT_IO,
     ):
         """Initialize the IRS bulletin scraper.
 
         Args:
             output_dir: Directory to save downloaded PDFs (defaults to centralized path)
             csv_file: Path to CSV summary file (defaults to centralized path)
-            max_workers: Number of concurrent downloads
+            max_workers: Most concurrent downloads; the download pool starts here
+                and only shrinks below it when throughput drops
             max_retries: Maximum number of retries for failed requests
             timeout: Request timeout in seconds
             max_pages: Maximum number of pages to scrape (None for unlimited)
+            max_concurrent_io: Number of download writes allowed to hit the
+                disk at once
         """
         # Use centralized paths if not specified
         if not output_dir:
@@ -62,31 +286,94 @@ class IRSBulletinScraper:
         self.timeout = timeout
         self.max_pages = max_pages if max_pages is not None else float("inf")
         self.logger = logging.getLogger(self.__class__.__name__)
+        # Caps concurrent download writes, independently of the number of
+        # network-bound workers
+        self._io_sem = threading.BoundedSemaphore(max_concurrent_io)
+        # Per-file metadata from the last directory scan, reset when files change
+        self._inventory_cache: Optional[Dict[str, Dict]] = None
+        # Validators and parsed links per index page, for conditional requests
+        self._page_cache_file = self.output_dir / PAGE_CACHE_FILENAME
+        self._page_cache: Dict[str, Dict] = {}
+        # Spaces out index page requests, which may be fetched concurrently
+        self._page_rate_limiter = _RateLimiter(
+            1 / DELAY_BETWEEN_PAGES if DELAY_BETWEEN_PAGES > 0 else None
+        )
 
         # Create directories if they don't exist
         self.output_dir.mkdir(parents=True, exist_ok=True)
         ensure_dir_exists(self.csv_file.parent)
 
+        # Shared session so all pages and downloads reuse keep-alive connections;
+        # run() fetches index pages while downloads are in flight, so the pool
+        # holds a connection for every worker of both kinds
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=max_workers + PAGE_FETCH_WORKERS,
+            max_retries=0,
+        )
+        self._session.mount("https://", adapter)
+        self._session.headers.update(
+            {"Connection": "keep-alive", "Accept-Encoding": "gzip, deflate"}
+        )
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> "IRSBulletinScraper":
+        """Use the scraper as a context manager that closes its session.
+
+        Returns:
+            The scraper itself
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the HTTP session when leaving the with block.
+
+        Args:
+            exc_type: Type of the exception raised in the block, if any
+            exc_value: Exception raised in the block, if any
+            traceback: Traceback of the exception, if any
+        """
+        self.close()
+
     # ============================================================================
     # CORE SCRAPING AND DOWNLOADING
     # ============================================================================
 
     def make_request(
-        self, url: str, stream: bool = False
+        self,
+        url: str,
+        stream: bool = False,
+        extra_headers: Optional[Dict[str, str]] = None,
     ) -> Optional[requests.Response]:
         """Make a robust HTTP request with retries and exponential backoff.
 
         Args:
             url: URL to request
             stream: Whether to stream the response
+            extra_headers: Additional request headers, e.g. conditional validators
 
         Returns:
-            Response object or None if all retries failed
+            Response object (status 200, or 304 if extra_headers carried an
+            If-None-Match/If-Modified-Since validator) or None if all retries
+            failed
         """
+        # Only a request carrying a validator can legitimately get a 304
+        conditional = bool(extra_headers) and any(
+            header in extra_headers for header in ("If-None-Match", "If-Modified-Since")
+        )
+
         for attempt in range(self.max_retries):
             try:
-                response = requests.get(url, stream=stream, timeout=self.timeout)
-                if response.status_code == 200:
+                response = self._session.get(
+                    url, stream=stream, timeout=self.timeout, headers=extra_headers
+                )
+                if response.status_code == 200 or (
+                    conditional and response.status_code == 304
+                ):
                     return response
                 else:
                     self.logger.warning(
@@ -139,99 +426,219 @@ class IRSBulletinScraper:
         Returns:
             List of tuples containing (filename, url)
         """
-        bulletin_links = []
+        return list(self.iter_document_links())
+
+    def iter_document_links(self) -> Iterator[Tuple[str, str]]:
+        """Scrape bulletin links page by page, yielding each as soon as it is found.
+
+        Yields:
+            Tuples containing (filename, url)
+        """
+        seen = set()
         page_num = 0
+        self._load_page_cache()
+
+        # Keep a few pages in flight and consume them in page order; the rate
+        # limiter rather than a sleep per page keeps requests spaced out
+        executor = ThreadPoolExecutor(
+            max_workers=PAGE_FETCH_WORKERS, thread_name_prefix="index-page"
+        )
+        pending = deque()
+        next_page = 0
+        stopped = threading.Event()
 
-        while page_num < self.max_pages:
-            url = self.BASE_URL if page_num == 0 else f"{self.BASE_URL}?page={page_num}"
-            self.logger.info(f"Scraping page {page_num + 1}: {url}")
+        try:
+            while page_num < self.max_pages:
+                while next_page < self.max_pages and len(pending) < PAGE_FETCH_WORKERS:
+                    pending.append(
+                        executor.submit(self._fetch_page, next_page, stopped)
+                    )
+                    next_page += 1
 
-            response = self.make_request(url)
-            if not response:
-                self.logger.error(f"Failed to fetch page {page_num + 1}")
-                break
+                page = pending.popleft().result()
+                if page is None:
+                    self.logger.error(f"Failed to fetch page {page_num + 1}")
+                    break
 
-            soup = BeautifulSoup(response.content, "html.parser")
+                page_links, has_next_page = page
 
-            # Find all bulletin links in the current page
-            links_found = False
-            for link in soup.find_all(
-                "a", href=re.compile(r"/pub/irs-irbs/irb\d+-\d+\.pdf")
-            ):
-                pdf_url = urljoin("https://www.irs.gov", link["href"])
-                bulletin_name = os.path.basename(pdf_url)
+                # Yield bulletins not already collected from an earlier page
+                links_found = False
+                for bulletin_name, pdf_url in page_links:
+                    if bulletin_name in seen:
+                        continue
 
-                # Check if we already have this bulletin in our list (avoid duplicates)
-                if not any(bulletin_name == name for name, _ in bulletin_links):
-                    bulletin_links.append((bulletin_name, pdf_url))
+                    seen.add(bulletin_name)
                     links_found = True
+                    yield bulletin_name, pdf_url
 
-            if not links_found:
-                self.logger.info(
-                    f"No bulletin links found on page {page_num + 1}, might be the last page."
-                )
-                break
+                if not links_found:
+                    self.logger.info(
+                        f"No bulletin links found on page {page_num + 1}, "
+                        "might be the last page."
+                    )
+                    break
 
-            # Check for next page
-            if not self._has_next_page(soup):
-                self.logger.info(
-                    f"No 'Next' link found on page {page_num + 1}, reached the last page."
-                )
-                break
+                # Check for next page
+                if not has_next_page:
+                    self.logger.info(
+                        f"No 'Next' link found on page {page_num + 1}, "
+                        "reached the last page."
+                    )
+                    break
 
-            page_num += 1
-            time.sleep(DELAY_BETWEEN_PAGES)  # Be nice to the server
+                page_num += 1
+        finally:
+            # Pages past the last one, or past where the consumer stopped
+            # reading, are not needed
+            stopped.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+            self._save_page_cache()
 
-        self.logger.info(f"Found {len(bulletin_links)} bulletins across all pages")
-        return bulletin_links
+        self.logger.info(f"Found {len(seen)} bulletins across all pages")
 
-    def _has_next_page(self, soup: BeautifulSoup) -> bool:
-        """Check if there's a next page available.
+    def _fetch_page(
+        self, page_num: int, stopped: Optional[threading.Event] = None
+    ) -> Optional[Tuple[List[Tuple[str, str]], bool]]:
+        """Fetch one index page, reusing cached links if it has not changed.
+
+        Pages fetched before are requested with If-None-Match/If-Modified-Since,
+        so an unchanged page comes back as an empty 304 response.
 
         Args:
-            soup: BeautifulSoup object of the current page
+            page_num: Zero-based index page number
+            stopped: Event set once the page is no longer needed
 
         Returns:
-            True if next page exists, False otherwise
+            Tuple of (list of (filename, url) on the page, whether a next page
+            exists) or None if the page could not be fetched
         """
-        pagination = soup.find("ul", class_="pagination")
-        if not pagination:
-            return False
+        url = self.BASE_URL if page_num == 0 else f"{self.BASE_URL}?page={page_num}"
+        self._page_rate_limiter.acquire()  # Be nice to the server
+        if stopped is not None and stopped.is_set():
+            return None
+        self.logger.info(f"Scraping page {page_num + 1}: {url}")
 
-        # Look for the "Next" link
-        for li in pagination.find_all("li", class_="pager__item--next"):
-            a_tag = li.find("a")
-            if a_tag and "Next" in a_tag.text:
-                return True
+        cached = self._page_cache.get(str(page_num))
+        extra_headers = {}
+        if cached:
+            if cached.get("etag"):
+                extra_headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                extra_headers["If-Modified-Since"] = cached["last_modified"]
 
-        # If no specific Next class, look for any link with "Next" text
-        for a_tag in pagination.find_all("a"):
-            if "Next" in a_tag.text:
-                return True
+        response = self.make_request(url, extra_headers=extra_headers)
+        if not response:
+            return None
+
+        if response.status_code == 304 and cached:
+            self.logger.info(f"Page {page_num + 1} not modified, using cached links")
+            return [tuple(link) for link in cached["links"]], cached["has_next_page"]
+
+        try:
+            tree = lxml.html.fromstring(response.content)
+        except etree.ParserError:
+            # Empty body, treated like a page without links
+            return [], False
+
+        # Find all bulletin links in the current page
+        page_links = []
+        for href in tree.xpath("//a/@href"):
+            if self._PDF_HREF_RE.search(href):
+                pdf_url = urljoin("https://www.irs.gov", href)
+                page_links.append((os.path.basename(pdf_url), pdf_url))
+
+        has_next_page = self._has_next_page(tree)
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._page_cache[str(page_num)] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "links": page_links,
+                "has_next_page": has_next_page,
+            }
+
+        return page_links, has_next_page
+
+    def _load_page_cache(self) -> None:
+        """Load index page validators and links saved by a previous run."""
+        if not self._page_cache_file.exists():
+            return
+
+        try:
+            with open(self._page_cache_file, "r", encoding="utf-8") as f:
+                self._page_cache = json.load(f)
+        except Exception as e:
+            self.logger.warning(f"Error reading page cache: {str(e)}")
+            self._page_cache = {}
 
-        return False
+    def _save_page_cache(self) -> None:
+        """Persist index page validators and links for the next run."""
+        try:
+            with open(self._page_cache_file, "w", encoding="utf-8") as f:
+                # Copy first, as prefetch threads may still be adding pages
+                json.dump(dict(self._page_cache), f)
+        except Exception as e:
+            self.logger.warning(f"Error saving page cache: {str(e)}")
+
+    def _has_next_page(self, tree: lxml.html.HtmlElement) -> bool:
+        """Check if there's a next page available.
 
-    def process_document(self, file_path: Path) -> Dict:
+        Args:
+            tree: Parsed lxml tree of the current page
+
+        Returns:
+            True if next page exists, False otherwise
+        """
+        # Any link with "Next" text inside the pagination list
+        return bool(
+            tree.xpath(
+                "//ul[contains(concat(' ', normalize-space(@class), ' '),"
+                " ' pagination ')]//a[contains(., 'Next')]"
+            )
+        )
+
+    def process_document(
+        self, file_path: Path, size_bytes: Optional[int] = None
+    ) -> Dict:
         """Process a downloaded bulletin and extract metadata.
 
         Args:
             file_path: Path to the downloaded PDF file
+            size_bytes: File size in bytes if already known, to skip a stat
 
         Returns:
             Dictionary containing document metadata
         """
+        if size_bytes is None:
+            size_mb = self.get_file_size_mb(file_path)
+        else:
+            size_mb = size_bytes / (1024 * 1024)
+
         return {
             "file_name": file_path.name,
-            "file_size_mb": round(self.get_file_size_mb(file_path), 2),
+            "file_size_mb": round(size_mb, 2),
             "download_timestamp": self.get_timestamp(),
             "status": "downloaded",
         }
 
-    def download_bulletin(self, bulletin_info: Tuple[str, str]) -> Dict:
+    def download_bulletin(
+        self,
+        bulletin_info: Tuple[str, str],
+        progress: Optional[Callable[[int], None]] = None,
+        check_existing: bool = False,
+    ) -> Dict:
         """Download a single bulletin PDF file.
 
+        Callers are expected to filter out bulletins that are already on disk;
+        pass check_existing to have this method stat the file and skip it.
+
         Args:
             bulletin_info: Tuple of (filename, url)
+            progress: Called with the number of bytes after each write
+            check_existing: Skip the download if the file already exists
 
         Returns:
             Dictionary containing download result metadata
@@ -240,7 +647,7 @@ class IRSBulletinScraper:
         file_path = self.output_dir / bulletin_name
 
         # Skip if file already exists
-        if file_path.exists():
+        if check_existing and file_path.exists():
             self.logger.info(f"Skipping {bulletin_name} (already exists)")
             return {
                 "file_name": bulletin_name,
@@ -261,12 +668,26 @@ class IRSBulletinScraper:
                 "status": "failed",
             }
 
-        try:
-            with open(file_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
-                    f.write(chunk)
+        # Write to a .part file so an interrupted or preallocated download
+        # never appears under the final name
+        part_path = file_path.with_name(bulletin_name + PART_SUFFIX)
 
-            result = self.process_document(file_path)
+        try:
+            # Copy in C with a large buffer instead of iterating chunks in Python
+            response.raw.decode_content = True
+            with open(part_path, "wb") as f:
+                expected_size = self._expected_body_size(response)
+                if expected_size:
+                    self._preallocate(f, expected_size)
+                writer = _ThrottledWriter(f, self._io_sem, progress)
+                shutil.copyfileobj(response.raw, writer, length=CHUNK_SIZE)
+                # Drop any reserved space the body did not fill
+                size_bytes = f.tell()
+                f.truncate(size_bytes)
+            os.replace(part_path, file_path)
+            self._inventory_cache = None
+
+            result = self.process_document(file_path, size_bytes)
             self.logger.info(
                 f"Downloaded {bulletin_name} ({result['file_size_mb']} MB)"
             )
@@ -275,8 +696,8 @@ class IRSBulletinScraper:
         except Exception as e:
             self.logger.error(f"Error saving {bulletin_name}: {str(e)}")
             # Clean up partial file
-            if file_path.exists():
-                file_path.unlink()
+            if part_path.exists():
+                part_path.unlink()
 
             return {
                 "file_name": bulletin_name,
@@ -285,6 +706,38 @@ class IRSBulletinScraper:
                 "status": "failed",
             }
 
+    def _expected_body_size(self, response: requests.Response) -> int:
+        """Get the size of the decoded response body from Content-Length.
+
+        Args:
+            response: Streamed download response
+
+        Returns:
+            Body size in bytes, or 0 if unknown
+        """
+        # Content-Length counts encoded bytes, not what gets written to disk
+        if response.headers.get("Content-Encoding", "identity") != "identity":
+            return 0
+
+        try:
+            return max(int(response.headers.get("Content-Length", 0)), 0)
+        except ValueError:
+            return 0
+
+    def _preallocate(self, f, size: int) -> None:
+        """Reserve disk space for a file before writing it sequentially.
+
+        Args:
+            f: File object opened for writing
+            size: Number of bytes to reserve
+        """
+        try:
+            os.posix_fallocate(f.fileno(), 0, size)
+        except (AttributeError, OSError):
+            # No fallocate on this platform or filesystem; extend the file instead
+            f.truncate(size)
+            f.seek(0)
+
     def get_existing_files(self) -> Dict[str, Dict]:
         """Get metadata for existing files from CSV summary.
 
@@ -306,25 +759,45 @@ class IRSBulletinScraper:
 
         return existing_files
 
-    def create_csv_summary(self, download_results: List[Dict]) -> None:
+    def create_csv_summary(
+        self, download_results: List[Dict], compact: bool = False
+    ) -> None:
         """Create or update CSV summary of downloaded files.
 
+        Results for files without a row yet are appended to the existing CSV.
+        The whole file is rewritten, deduplicated and sorted by filename, only
+        when a result replaces an existing row or when compact is requested.
+
         Args:
             download_results: List of download result dictionaries
+            compact: Always rewrite the full CSV, deduplicated and sorted
         """
         # Get existing files from CSV
         existing_files = self.get_existing_files()
 
+        if (
+            existing_files
+            and not compact
+            and all(r["file_name"] not in existing_files for r in download_results)
+        ):
+            try:
+                with open(self.csv_file, "a", newline="", encoding="utf-8") as csvfile:
+                    writer = csv.DictWriter(csvfile, fieldnames=CSV_FIELDNAMES)
+                    writer.writerows(download_results)
+
+                self.logger.info(f"CSV summary appended: {self.csv_file}")
+
+            except Exception as e:
+                self.logger.error(f"Error appending to CSV summary: {str(e)}")
+            return
+
         # Update with new results
         for result in download_results:
             existing_files[result["file_name"]] = result
 
-        # Write updated CSV
-        fieldnames = CSV_FIELDNAMES
-
         try:
             with open(self.csv_file, "w", newline="", encoding="utf-8") as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+                writer = csv.DictWriter(csvfile, fieldnames=CSV_FIELDNAMES)
                 writer.writeheader()
 
                 # Sort by filename for consistent output
@@ -340,37 +813,37 @@ class IRSBulletinScraper:
         """Run the complete scraping and download process."""
         self.logger.info("Starting IRS bulletin scraping process")
 
-        # Get all bulletin links
-        bulletin_links = self.get_document_links()
+        found_count = 0
+        new_count = 0
 
-        if not bulletin_links:
+        # Start downloading each new bulletin while later pages are still
+        # scraped; the pool resizes itself, up to max_workers, to follow the
+        # bytes streamed per interval
+        pool = _AdaptiveWorkerPool(self.download_bulletin, self.max_workers)
+        # One directory scan up front instead of a stat per bulletin
+        local_files = self._list_local_pdfs()
+
+        pool.start()
+        try:
+            for bulletin in self.iter_document_links():
+                found_count += 1
+                if bulletin[0] in local_files:
+                    continue
+                pool.submit(bulletin)
+                new_count += 1
+        finally:
+            download_results = pool.join()
+
+        if not found_count:
             self.logger.warning("No bulletin links found")
             return
 
-        # Filter out already downloaded files
-        new_bulletins = [
-            (name, url) for name, url in bulletin_links if not self.file_exists(name)
-        ]
-
-        self.logger.info(f"Found {len(new_bulletins)} new bulletins to download")
+        self.logger.info(f"Found {new_count} new bulletins to download")
 
-        if not new_bulletins:
+        if not new_count:
             self.logger.info("No new bulletins to download")
             return
 
-        # Download bulletins concurrently
-        download_results = []
-
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_bulletin = {
-                executor.submit(self.download_bulletin, bulletin): bulletin
-                for bulletin in new_bulletins
-            }
-
-            for future in as_completed(future_to_bulletin):
-                result = future.result()
-                download_results.append(result)
-
         # Update CSV summary
         self.create_csv_summary(download_results)
 
@@ -390,12 +863,8 @@ class IRSBulletinScraper:
         Returns:
             Set of bulletin filenames that exist locally
         """
-        local_bulletins = set()
-
         # Check files in directory
-        if self.output_dir.exists():
-            for file_path in self.output_dir.glob("*.pdf"):
-                local_bulletins.add(file_path.name)
+        local_bulletins = self._list_local_pdfs()
 
         # Also check CSV file for additional records
         if self.csv_file.exists():
@@ -410,6 +879,25 @@ class IRSBulletinScraper:
 
         return local_bulletins
 
+    def _list_local_pdfs(self) -> Set[str]:
+        """List PDF filenames in the output directory with a single scandir pass.
+
+        Always reads the directory rather than the inventory cache, so files
+        removed by other processes are downloaded again.
+
+        Returns:
+            Set of PDF filenames in the output directory
+        """
+        if not self.output_dir.exists():
+            return set()
+
+        with os.scandir(self.output_dir) as entries:
+            return {
+                entry.name
+                for entry in entries
+                if entry.name.endswith(".pdf") and entry.is_file()
+            }
+
     def get_remote_bulletins(self, limit: int = None) -> List[Tuple[str, str]]:
         """Get list of bulletins available on the IRS website.
 
@@ -419,24 +907,14 @@ class IRSBulletinScraper:
         Returns:
             List of tuples containing (filename, url)
         """
-        if limit and limit <= 50:
-            # For small limits, create a temporary scraper to avoid scraping too many pages
-            limited_pages = max(1, (limit // 20) + 1)  # Roughly 20 bulletins per page
-
-            # Temporarily override max_pages for this call
-            original_max_pages = self.max_pages
-            self.max_pages = limited_pages
-            all_bulletins = self.get_document_links()
-            self.max_pages = original_max_pages  # Restore original value
-        else:
-            # For larger limits or no limit, use current settings
-            all_bulletins = self.get_document_links()
-
-        if limit:
-            # Return most recent bulletins (assuming they're in chronological order)
-            return all_bulletins[:limit]
-
-        return all_bulletins
+        # Stop scraping as soon as enough bulletins have been seen; closing the
+        # generator stops any pages still being prefetched
+        links = self.iter_document_links()
+        try:
+            # Most recent bulletins come first on the index pages
+            return list(itertools.islice(links, limit or None))
+        finally:
+            links.close()
 
     def check_for_new_bulletins(self, limit: int = 20) -> Dict:
         """Check for new bulletins available for download.
@@ -542,9 +1020,13 @@ class IRSBulletinScraper:
     # PROCESSING AND VALIDATION
     # ============================================================================
 
-    def validate_pdf_files(self) -> Dict[str, bool]:
+    def validate_pdf_files(self, max_workers: Optional[int] = None) -> Dict[str, bool]:
         """Validate that all PDF files are properly downloaded and readable.
 
+        Args:
+            max_workers: Number of threads reading files in parallel
+                (defaults to 4 per CPU, at most 32)
+
         Returns:
             Dictionary mapping filename to validation status
         """
@@ -556,24 +1038,13 @@ class IRSBulletinScraper:
             )
             return validation_results
 
-        for pdf_file in self.output_dir.glob("*.pdf"):
-            try:
-                # Basic validation - check if file is not empty
-                if pdf_file.stat().st_size == 0:
-                    validation_results[pdf_file.name] = False
-                    self.logger.warning(f"Empty file: {pdf_file.name}")
-                    continue
+        for filename, metadata in self._scan_inventory(max_workers).items():
+            validation_results[filename] = metadata["is_valid_pdf"]
 
-                # More flexible PDF validation for older files
-                is_valid = self._is_valid_pdf_flexible(pdf_file)
-                validation_results[pdf_file.name] = is_valid
-
-                if not is_valid:
-                    self.logger.warning(f"Invalid or corrupted PDF: {pdf_file.name}")
-
-            except Exception as e:
-                validation_results[pdf_file.name] = False
-                self.logger.error(f"Error validating {pdf_file.name}: {str(e)}")
+            if metadata["file_size_bytes"] == 0:
+                self.logger.warning(f"Empty file: {filename}")
+            elif not metadata["is_valid_pdf"]:
+                self.logger.warning(f"Invalid or corrupted PDF: {filename}")
 
         valid_count = sum(validation_results.values())
         total_count = len(validation_results)
@@ -584,38 +1055,110 @@ class IRSBulletinScraper:
 
         return validation_results
 
-    def _is_valid_pdf_flexible(self, file_path: Path) -> bool:
+    def _scan_inventory(self, max_workers: Optional[int] = None) -> Dict[str, Dict]:
+        """Stat and validate every PDF in the output directory in a single pass.
+
+        The result is cached until a download or cleanup changes the directory,
+        so validation, statistics and reports share one scan.
+
+        Args:
+            max_workers: Number of threads reading files in parallel
+                (defaults to 4 per CPU, at most 32)
+
+        Returns:
+            Dictionary mapping filename to file metadata
+        """
+        if self._inventory_cache is not None:
+            return self._inventory_cache
+
+        pdf_files = []
+        if self.output_dir.exists():
+            with os.scandir(self.output_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".pdf") or not entry.is_file():
+                        continue
+                    try:
+                        pdf_files.append((Path(entry.path), entry.stat()))
+                    except Exception as e:
+                        self.logger.error(f"Error scanning {entry.name}: {str(e)}")
+
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+
+        # Header reads are latency-bound, so overlap them across threads
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            validity = executor.map(
+                self._is_valid_pdf_flexible,
+                [path for path, _ in pdf_files],
+                [stat.st_size for _, stat in pdf_files],
+            )
+            inventory = {
+                file_path.name: self._build_file_metadata(file_path, stat, is_valid)
+                for (file_path, stat), is_valid in zip(pdf_files, validity)
+            }
+
+        self._inventory_cache = inventory
+        return inventory
+
+    def _build_file_metadata(
+        self, file_path: Path, stat: os.stat_result, is_valid: Optional[bool] = None
+    ) -> Dict:
+        """Build the metadata dictionary for a file from its stat result.
+
+        Args:
+            file_path: Path to the file
+            stat: Result of stat() on the file
+            is_valid: Known validation result (validated here when None)
+
+        Returns:
+            Dictionary containing file metadata
+        """
+        if is_valid is None:
+            is_valid = self._is_valid_pdf_flexible(file_path, stat.st_size)
+
+        return {
+            "filename": file_path.name,
+            "file_size_bytes": stat.st_size,
+            "file_size_mb": round(stat.st_size / (1024 * 1024), 2),
+            "created_timestamp": stat.st_ctime,
+            "modified_timestamp": stat.st_mtime,
+            "is_valid_pdf": is_valid,
+        }
+
+    def _is_valid_pdf_flexible(
+        self, file_path: Path, file_size: Optional[int] = None
+    ) -> bool:
         """Check if a file is a valid PDF with flexible validation for older files.
 
         Args:
             file_path: Path to the file
+            file_size: Size of the file in bytes if already known
 
         Returns:
             True if valid PDF, False otherwise
         """
         try:
-            if file_path.stat().st_size == 0:
+            if file_size is None:
+                file_size = file_path.stat().st_size
+            if file_size == 0:
                 return False
 
             with open(file_path, "rb") as f:
-                # Read more bytes to check for various PDF signatures
-                header = f.read(1024)
-
-                # Check for standard PDF header
-                if header.startswith(b"%PDF"):
+                # Almost every file starts with a standard PDF or PostScript
+                # signature, so check the first few bytes before reading more
+                header = f.read(8)
+                if header.startswith(b"%PDF") or header.startswith(b"%!PS"):
                     return True
 
+                header += f.read(1016)
+
                 # Check for older PDF formats or variations
                 # Some older PDFs might have different headers or encoding
                 if b"PDF" in header[:100]:  # PDF mentioned in first 100 bytes
                     return True
 
-                # Check for PostScript files that might be valid (some old bulletins)
-                if header.startswith(b"%!PS"):
-                    return True
-
                 # Check if file has reasonable size (not just a few bytes of garbage)
-                if file_path.stat().st_size < 1024:  # Less than 1KB is suspicious
+                if file_size < 1024:  # Less than 1KB is suspicious
                     return False
 
                 # If file is reasonably sized and has .pdf extension,
@@ -634,24 +1177,20 @@ class IRSBulletinScraper:
         Returns:
             Dictionary containing file metadata or None if file doesn't exist
         """
+        # Use an earlier full scan if there is one, but don't start one for a
+        # single file
+        if self._inventory_cache is not None:
+            cached = self._inventory_cache.get(filename)
+            if cached:
+                return dict(cached)
+
         file_path = self.output_dir / filename
 
         if not file_path.exists():
             return None
 
         try:
-            stat = file_path.stat()
-
-            metadata = {
-                "filename": filename,
-                "file_size_bytes": stat.st_size,
-                "file_size_mb": round(stat.st_size / (1024 * 1024), 2),
-                "created_timestamp": stat.st_ctime,
-                "modified_timestamp": stat.st_mtime,
-                "is_valid_pdf": self._is_valid_pdf_flexible(file_path),
-            }
-
-            return metadata
+            return self._build_file_metadata(file_path, file_path.stat())
 
         except Exception as e:
             self.logger.error(f"Error getting metadata for {filename}: {str(e)}")
@@ -692,6 +1231,7 @@ class IRSBulletinScraper:
                     self.logger.info(f"  - Deleted: {filename}")
                 except Exception as e:
                     self.logger.error(f"  - Failed to delete {filename}: {str(e)}")
+            self._inventory_cache = None
 
         return invalid_files
 
@@ -710,21 +1250,22 @@ class IRSBulletinScraper:
                 "average_size_mb": 0,
             }
 
-        pdf_files = list(self.output_dir.glob("*.pdf"))
+        inventory = self._scan_inventory()
         validation_results = self.validate_pdf_files()
 
-        total_size = sum(f.stat().st_size for f in pdf_files)
+        total_files = len(inventory)
+        total_size = sum(m["file_size_bytes"] for m in inventory.values())
         valid_count = sum(validation_results.values())
         invalid_count = len(validation_results) - valid_count
 
         stats = {
-            "total_files": len(pdf_files),
+            "total_files": total_files,
             "total_size_mb": round(total_size / (1024 * 1024), 2),
             "valid_files": valid_count,
             "invalid_files": invalid_count,
             "average_size_mb": (
-                round(total_size / (1024 * 1024) / len(pdf_files), 2)
-                if pdf_files
+                round(total_size / (1024 * 1024) / total_files, 2)
+                if total_files
                 else 0
             ),
         }
@@ -755,14 +1296,13 @@ class IRSBulletinScraper:
             "-" * 15,
         ]
 
-        if self.output_dir.exists():
-            for pdf_file in sorted(self.output_dir.glob("*.pdf")):
-                metadata = self.get_file_metadata(pdf_file.name)
-                if metadata:
-                    status = "✓" if metadata["is_valid_pdf"] else "✗"
-                    report_lines.append(
-                        f"{status} {metadata['filename']} ({metadata['file_size_mb']} MB)"
-                    )
+        inventory = self._scan_inventory()
+        for filename in sorted(inventory):
+            metadata = inventory[filename]
+            status = "✓" if metadata["is_valid_pdf"] else "✗"
+            report_lines.append(
+                f"{status} {metadata['filename']} ({metadata['file_size_mb']} MB)"
+            )
 
         report_text = "\n".join(report_lines)
 